@@ -0,0 +1,38 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setUpModule():
+    # main opens its database, logs and backups relative to the working directory on import
+    global main, _old_cwd, _tmpdir
+    _old_cwd = os.getcwd()
+    _tmpdir = tempfile.TemporaryDirectory()
+    os.chdir(_tmpdir.name)
+    sys.path.insert(0, ROOT)
+    main = importlib.import_module("main")
+
+
+def tearDownModule():
+    os.chdir(_old_cwd)
+
+
+class StateCodecTest(unittest.TestCase):
+    def test_balance_beyond_64_bits_round_trips_exactly(self):
+        # Odd values, so a float that only approximates them compares unequal
+        user = main.UserState(trial=2**70 + 1, premium=-(2**65) - 1)
+        decoded = main.UserState.from_dict(main.decode_state(main.encode_state(user)))
+        self.assertEqual(decoded.trial, 2**70 + 1)
+        self.assertEqual(decoded.premium, -(2**65) - 1)
+
+    def test_legacy_bytes_round_trip_exactly(self):
+        data = main.decode_state(b'{"1":{"trial":1180591620717411303425}}')
+        self.assertEqual(data["1"]["trial"], 2**70 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()